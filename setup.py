@@ -9,8 +9,14 @@ setup(
         "rich>=10.0.0",
         "inquirer>=2.7.0",
         "python-dateutil>=2.8.0",
-        "google-genai>=1.0.0"
+        "google-genai>=1.10.0",
+        "cachetools>=4.0.0",
+        "numpy>=1.17.0",
+        "orjson>=3.0.0"
     ],
+    extras_require={
+        "jit": ["numba>=0.50.0"],
+    },
     entry_points={
         'console_scripts': [
             'todo=smart_todo.cli:cli',
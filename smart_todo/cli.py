@@ -1,22 +1,144 @@
 #!/usr/bin/env python3
 
+import functools
+import hashlib
+import heapq
 import json
+import math
 import os
-from datetime import datetime, timedelta
+import re
+import shlex
+from datetime import date, datetime, timedelta
 from typing import Dict, List
 import click
+from cachetools import TTLCache
 from rich.console import Console
-from rich.table import Table
-from rich.text import Text
-import inquirer
-from dateutil import parser
-from inquirer import errors
-from google import genai
-from google.genai import types
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+# google.genai, inquirer, dateutil and rich's Table are imported where they
+# are used: loading them up front dominates start-up time for simple commands.
 
 console = Console()
 
+DEADLINE_FORMAT = "%Y-%m-%d %H:%M"
+
+# Gemini suggestions keyed by (mood, task fingerprint); reruns within the TTL
+# reuse the previous answer instead of making another API call.
+_SUGGEST_CACHE = TTLCache(maxsize=64, ttl=600)
+
+# How many of the locally best-scoring tasks are offered to Gemini
+SUGGESTION_SHORTLIST_SIZE = 15
+
+# How well a task's energy requirement suits the user's mood, added to its
+# urgency score when shortlisting
+MOOD_ENERGY_AFFINITY = {
+    ("energetic", "High"): 20, ("energetic", "Medium"): 10, ("energetic", "Low"): 0,
+    ("focused", "High"): 15, ("focused", "Medium"): 20, ("focused", "Low"): 5,
+    ("creative", "High"): 10, ("creative", "Medium"): 15, ("creative", "Low"): 10,
+    ("relaxed", "High"): 0, ("relaxed", "Medium"): 10, ("relaxed", "Low"): 20,
+    ("tired", "High"): 0, ("tired", "Medium"): 5, ("tired", "Low"): 20,
+}
+
+# A task scoring at least DOMINANT_URGENCY while every other task scores at
+# most DOMINANT_RUNNER_UP is suggested without asking Gemini
+DOMINANT_URGENCY = 95
+DOMINANT_RUNNER_UP = 40
+
+GEMINI_MODEL = "gemini-2.5-flash-preview-04-17"
+
+# Static part of the suggestion prompt. It is sent as the system instruction so
+# every request shares the same prefix and only mood, time and tasks vary.
+SUGGESTION_INSTRUCTIONS = """
+You are a task recommendation engine. Your goal is to suggest the best task for the user to work on right now.
+
+The user message gives the user's current mood, the current time and the available tasks as JSON.
+
+Consider these factors in order of importance:
+1. Task urgency (based on deadline and urgency_score)
+2. Match between task's energy/difficulty requirements and user's current mood
+3. Priority level of the task
+4. Task complexity and estimated effort
+
+Guidelines:
+- If user is energetic: Prefer challenging tasks that require high energy
+- If user is focused: Prefer complex tasks that require concentration
+- If user is creative: Prefer tasks that involve planning or creative work
+- If user is relaxed: Prefer lighter tasks unless there's something urgent
+
+Format your response exactly like this:
+TASK: [Suggested Task id] - [Suggested Task Title]
+REASON: [1-2 sentences explaining why this task is the best choice right now]
+"""
+
+# Created on first use and reused, so repeated suggestions in one process
+# share the client's connection pool.
+_CLIENT = None
+_CONFIG = None
+
+def _gemini_client():
+    global _CLIENT
+    if _CLIENT is None:
+        from google import genai
+        _CLIENT = genai.Client(api_key=os.environ.get("GEMINI_API_KEY"))
+    return _CLIENT
+
+def _suggestion_config():
+    global _CONFIG
+    if _CONFIG is None:
+        from google.genai import types
+        _CONFIG = types.GenerateContentConfig(
+            system_instruction=SUGGESTION_INSTRUCTIONS,
+            response_mime_type="text/plain",
+            # The answer is two short lines; a small budget and no thinking
+            # keep the model from spending time on anything else.
+            max_output_tokens=80,
+            temperature=0.2,
+            thinking_config=types.ThinkingConfig(thinking_budget=0),
+        )
+    return _CONFIG
+
+def _mood_affinity(current_mood: str, task) -> int:
+    affinity = MOOD_ENERGY_AFFINITY.get((current_mood, task.energy_required), 0)
+    if task.mood_required == current_mood:
+        affinity += 10
+    return affinity
+
+def _score_tasks(tasks, now):
+    """Batch urgency scoring; NumPy (and numba, if installed) load on first use"""
+    try:
+        from .urgency import score_tasks
+    except ImportError:  # running cli.py directly as a script
+        from urgency import score_tasks
+    return score_tasks(tasks, now)
+
+def _encode_record(record: Dict) -> bytes:
+    """One compact JSON line for the task log"""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return json.dumps(record, separators=(',', ':')).encode() + b'\n'
+
+_decode_record = orjson.loads if orjson is not None else json.loads
+
+def _json_string(value: str) -> str:
+    """value as an escaped JSON string literal"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+def _json_hours(hours: float) -> str:
+    return "null" if math.isnan(hours) else f"{hours:.2f}"
+
 class Task:
+    __slots__ = (
+        "title", "description", "deadline", "priority", "mood_required",
+        "effort", "difficulty", "energy_required", "completed", "status",
+        "suggestion_reason", "_deadline_dt"
+    )
+
     MOOD_ICONS = {
         "any": "*",
         "energetic": "[E]",
@@ -32,6 +154,18 @@ class Task:
     ENERGY_LEVELS = ["Low", "Medium", "High"]
     PRIORITY_LEVELS = ["Low", "Medium", "High", "Critical"]
 
+    PRIORITY_STYLES = {
+        1: "blue",
+        2: "yellow",
+        3: "red bold",
+        4: "red bold reverse"
+    }
+    STATUS_STYLES = {
+        "Not Started": "yellow",
+        "In Progress": "blue bold",
+        "Completed": "green"
+    }
+
     def __init__(self, title: str, description: str, deadline: str, 
                  priority: int = 1, mood_required: str = "any",
                  effort: str = "Medium", difficulty: str = "Medium",
@@ -47,6 +181,19 @@ class Task:
         self.completed = False
         self.status = "Not Started"  # Not Started, In Progress, Completed
         self.suggestion_reason = ""
+        self._deadline_dt = None
+
+    @property
+    def deadline_dt(self) -> datetime:
+        """Parsed deadline, computed once per task"""
+        if self._deadline_dt is None:
+            try:
+                self._deadline_dt = datetime.strptime(self.deadline, DEADLINE_FORMAT)
+            except ValueError:
+                # Older rows may use other formats (e.g. a bare date)
+                from dateutil import parser
+                self._deadline_dt = parser.parse(self.deadline)
+        return self._deadline_dt
 
     def to_dict(self) -> Dict:
         return {
@@ -78,53 +225,170 @@ class Task:
         task.status = data.get("status", "Not Started")
         return task
 
-    def calculate_urgency_score(self) -> float:
+    def calculate_urgency_score(self, now: datetime = None) -> float:
         """Calculate urgency score based on deadline and priority"""
-        try:
-            deadline = parser.parse(self.deadline)
+        if now is None:
             now = datetime.now()
-            hours_until_deadline = (deadline - now).total_seconds() / 3600
-
-            # Base urgency score based on time until deadline
-            if hours_until_deadline <= 24:
-                urgency = 100
-            elif hours_until_deadline <= 48:
-                urgency = 80
-            elif hours_until_deadline <= 72:
-                urgency = 60
-            else:
-                urgency = max(10, 100 - (hours_until_deadline / 24))
-
-            # Adjust based on priority (1-3 scale)
-            priority_multiplier = {1: 0.8, 2: 1.0, 3: 1.2}
-            urgency *= priority_multiplier.get(self.priority, 1.0)
-
-            return min(100, urgency)
-        except:
-            return 10  # Default low urgency for tasks without valid deadlines
+        _, urgency_scores = _score_tasks([self], now)
+        return float(urgency_scores[0])
 
     def get_mood_with_icon(self) -> str:
         return f"{self.MOOD_ICONS.get(self.mood_required, '')} {self.mood_required}"
 
 class TodoManager:
-    def __init__(self, filename: str = "tasks.json"):
+    def __init__(self, filename: str = "tasks.jsonl"):
         self.filename = filename
         self.tasks: List[Task] = []
+        # Titles are unique (add_task and the legacy import enforce it), so
+        # this maps each title to its one task
+        self._by_title: Dict[str, Task] = {}
+        self._log_records = 0  # lines currently in the log, live or superseded
         self.load_tasks()
 
     def load_tasks(self):
-        if os.path.exists(self.filename):
-            with open(self.filename, 'r') as f:
-                data = json.load(f)
-                self.tasks = [Task.from_dict(task_data) for task_data in data]
-
-    def save_tasks(self):
-        with open(self.filename, 'w') as f:
-            json.dump([task.to_dict() for task in self.tasks], f, indent=2)
+        """Replay the append-only log, folding status updates into their tasks"""
+        if not os.path.exists(self.filename):
+            self._import_legacy_file()
+            return
+
+        tasks: Dict[str, Task] = {}
+        records = 0
+        unreadable = 0
+        with open(self.filename, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = _decode_record(line)
+                except ValueError:
+                    # Left by an interrupted write; losing it beats losing the list
+                    unreadable += 1
+                    continue
+                records += 1
+                if record.get("op") == "status":
+                    task = tasks.get(record["title"])
+                    if task:
+                        task.status = record["status"]
+                        task.completed = record["completed"]
+                else:
+                    tasks[record["title"]] = Task.from_dict(record)
+        self.tasks = [task for task in tasks.values()]
+        self._by_title = tasks
+        self._log_records = records
+
+        if unreadable:
+            console.print(f"Skipped {unreadable} unreadable line(s) in {self.filename}",
+                          style="yellow")
+            # Rewrite now so new records aren't appended onto a partial line
+            self._rewrite_log()
+
+    def _import_legacy_file(self):
+        """Convert a tasks.json written by older versions into the log format"""
+        legacy_filename = os.path.splitext(self.filename)[0] + ".json"
+        if os.path.exists(legacy_filename):
+            with open(legacy_filename, 'rb') as f:
+                self.tasks = [Task.from_dict(task_data) for task_data in _decode_record(f.read())]
+
+            # Titles identify tasks in the log, so repeated ones get a suffix
+            self._by_title = {}
+            for task in self.tasks:
+                if task.title in self._by_title:
+                    title = task.title
+                    n = 2
+                    while f"{title} ({n})" in self._by_title:
+                        n += 1
+                    task.title = f"{title} ({n})"
+                    console.print(f"Renamed duplicate task '{title}' to '{task.title}'",
+                                  style="yellow")
+                self._by_title[task.title] = task
+            self._rewrite_log()
+
+    def _append(self, record: Dict):
+        with open(self.filename, 'ab') as f:
+            f.write(_encode_record(record))
+        self._log_records += 1
+        if self._log_records > 2 * len(self.tasks):
+            self.compact()
+
+    def compact(self):
+        """Rewrite the log with one record per live task
+
+        Other todo processes may have appended since this manager loaded, so
+        the log is replayed from disk first; every change made here is already
+        in it. This also refreshes self.tasks.
+        """
+        self.load_tasks()
+        self._rewrite_log()
+
+    def _rewrite_log(self):
+        """Write self.tasks as the whole log; only call right after a replay or import"""
+        tmp_filename = self.filename + ".tmp"
+        with open(tmp_filename, 'wb') as f:
+            f.write(b''.join(_encode_record(task.to_dict()) for task in self.tasks))
+        os.replace(tmp_filename, self.filename)
+        self._log_records = len(self.tasks)
+
+    def _append_status(self, task: Task):
+        self._append({
+            "op": "status",
+            "title": task.title,
+            "status": task.status,
+            "completed": task.completed
+        })
+
+    def has_task(self, title: str) -> bool:
+        return title in self._by_title
 
     def add_task(self, task: Task):
+        if self.has_task(task.title):
+            raise ValueError(f"A task titled '{task.title}' already exists")
         self.tasks.append(task)
-        self.save_tasks()
+        self._by_title[task.title] = task
+        self._append(task.to_dict())
+
+    @staticmethod
+    def _suggestion_cache_key(current_mood: str, tasks: List[Task]) -> bytes:
+        """Fingerprint the inputs that decide a suggestion (not the clock)"""
+        fingerprint = sorted(
+            (task.title, task.deadline, task.priority, task.status)
+            for task in tasks
+        )
+        return hashlib.blake2b(
+            json.dumps(fingerprint).encode() + current_mood.encode(),
+            digest_size=16
+        ).digest()
+
+    @staticmethod
+    def _resolve_suggestion(task_line: str, reason: str, tasks: List[Task]):
+        """Map the model's TASK line back to a task, by id or else by title"""
+        suggested_task = None
+        # Only "<id> - <title>" counts as an id; a title like "3 reports"
+        # alone goes to the title scan
+        match = re.match(r"\[?(\d+)\]?\s*-\s", task_line)
+        if match and int(match.group(1)) < len(tasks):
+            suggested_task = tasks[int(match.group(1))]
+        else:
+            task_line = task_line.lower()
+            for task in tasks:
+                if task.title.lower() in task_line:
+                    suggested_task = task
+                    break
+        if suggested_task:
+            suggested_task.suggestion_reason = reason
+        return suggested_task
+
+    @staticmethod
+    def _fallback_task(hours_until_deadline, tasks: List[Task]) -> Task:
+        """Earliest deadline, then highest priority, for when the AI can't help
+
+        Reuses the deadlines already parsed for scoring; index i breaks ties.
+        """
+        task = min(
+            (math.inf if math.isnan(hours) else hours, -task.priority, i, task)
+            for i, (hours, task) in enumerate(zip(hours_until_deadline.tolist(), tasks))
+        )[-1]
+        task.suggestion_reason = ""  # don't show a reason left from an earlier suggestion
+        return task
 
     def get_suggested_task(self, current_mood: str) -> Task:
         now = datetime.now()
@@ -136,117 +400,130 @@ class TodoManager:
         if not available_tasks:
             return None
 
-        # Prepare task data for AI analysis
-        tasks_info = []
-        for task in available_tasks:
-            deadline = parser.parse(task.deadline)
-            time_until_deadline = (deadline - now).total_seconds() / 3600  # hours
-            urgency_score = task.calculate_urgency_score()
-            
-            tasks_info.append({
-                "title": task.title,
-                "description": task.description,
-                "hours_until_deadline": time_until_deadline,
-                "urgency_score": urgency_score,
-                "priority": task.priority,
-                "mood_required": task.mood_required,
-                "effort": task.effort,
-                "difficulty": task.difficulty,
-                "energy_required": task.energy_required,
-                "status": task.status
-            })
+        # Nothing for the AI to choose between
+        if len(available_tasks) == 1:
+            suggested_task = available_tasks[0]
+            suggested_task.suggestion_reason = "It is your only open task."
+            return suggested_task
+
+        cache_key = self._suggestion_cache_key(current_mood, available_tasks)
+        if cache_key in _SUGGEST_CACHE:
+            title, reason = _SUGGEST_CACHE[cache_key]
+            suggested_task = self._by_title.get(title)
+            if suggested_task:
+                console.print("Using cached suggestion", style="dim")
+                suggested_task.suggestion_reason = reason
+                return suggested_task
+
+        hours_until_deadline, urgency_scores = _score_tasks(available_tasks, now)
+
+        # One task far more urgent than the rest needs no AI call
+        top_idx = int(urgency_scores.argmax())
+        top_score, runner_up = heapq.nlargest(2, urgency_scores.tolist())
+        if top_score >= DOMINANT_URGENCY and runner_up <= DOMINANT_RUNNER_UP:
+            suggested_task = available_tasks[top_idx]
+            hours = hours_until_deadline[top_idx]
+            if hours < 0:
+                suggested_task.suggestion_reason = (
+                    f"Overdue by {-hours:.1f}h - no other task is close."
+                )
+            else:
+                suggested_task.suggestion_reason = (
+                    f"Deadline in {hours:.1f}h - no other task is close."
+                )
+            return suggested_task
 
-        # Use Gemini API for smart task suggestion
-        client = genai.Client(
-            api_key=os.environ.get("GEMINI_API_KEY"),
+        # Shortlist the best local candidates so the prompt stays small
+        shortlist = heapq.nlargest(
+            SUGGESTION_SHORTLIST_SIZE,
+            range(len(available_tasks)),
+            key=lambda i: urgency_scores[i] + _mood_affinity(current_mood, available_tasks[i])
+        )
+        candidates = [available_tasks[i] for i in shortlist]
+
+        # Prepare task data for AI analysis, written straight to JSON text
+        tasks_json = "[\n  " + ",\n  ".join(
+            f'{{"id":{task_id},'
+            f'"title":{_json_string(task.title)},'
+            f'"description":{_json_string(task.description)},'
+            f'"hours_until_deadline":{_json_hours(hours_until_deadline[i])},'
+            f'"urgency_score":{urgency_scores[i]:.1f},'
+            f'"priority":{task.priority},'
+            f'"mood_required":{_json_string(task.mood_required)},'
+            f'"effort":{_json_string(task.effort)},'
+            f'"difficulty":{_json_string(task.difficulty)},'
+            f'"energy_required":{_json_string(task.energy_required)},'
+            f'"status":{_json_string(task.status)}}}'
+            for task_id, (i, task) in enumerate(zip(shortlist, candidates))
+        ) + "\n]"
+
+        console.print("Asking Gemini for a suggestion...", style="dim")
+
+        prompt = (
+            f"Mood: {current_mood}\n"
+            f"Current Time: {now.strftime(DEADLINE_FORMAT)}\n"
+            f"Available Tasks:\n{tasks_json}"
         )
 
-        prompt = f"""
-        You are a task recommendation engine. Your goal is to suggest the best task for the user to work on right now.
-        
-        User's Current State:
-        - Mood: {current_mood}
-        - Current Time: {now.strftime('%Y-%m-%d %H:%M')}
-        
-        Available Tasks:
-        {json.dumps(tasks_info, indent=2)}
-        
-        Consider these factors in order of importance:
-        1. Task urgency (based on deadline and urgency_score)
-        2. Match between task's energy/difficulty requirements and user's current mood
-        3. Priority level of the task
-        4. Task complexity and estimated effort
-        
-        Guidelines:
-        - If user is energetic: Prefer challenging tasks that require high energy
-        - If user is focused: Prefer complex tasks that require concentration
-        - If user is creative: Prefer tasks that involve planning or creative work
-        - If user is relaxed: Prefer lighter tasks unless there's something urgent
-        
-        Format your response exactly like this:
-        TASK: [Suggested Task Title]
-        REASON: [1-2 sentences explaining why this task is the best choice right now]
-        """
-
+        # Use Gemini API for smart task suggestion
         try:
-            model = "gemini-2.5-flash-preview-04-17"
+            from google.genai import types
+
+            client = _gemini_client()
             contents = [
                 types.Content(
                     role="user",
                     parts=[types.Part.from_text(text=prompt)],
                 ),
             ]
-            generate_content_config = types.GenerateContentConfig(
-                response_mime_type="text/plain",
-            )
 
-            response = client.models.generate_content(
-                model=model,
+            # Stream the answer and stop reading once the REASON line is complete
+            stream = client.models.generate_content_stream(
+                model=GEMINI_MODEL,
                 contents=contents,
-                config=generate_content_config,
-            ).text.strip()
+                config=_suggestion_config(),
+            )
+            response = ""
+            for chunk in stream:
+                response += chunk.text or ""
+                reason_start = response.find('REASON:')
+                if reason_start != -1 and '\n' in response[reason_start:]:
+                    break
+            stream.close()
 
             # Parse the response
             task_line = ""
             reason = ""
-            for line in response.split('\n'):
+            for line in response.strip().split('\n'):
+                line = line.strip()
                 if line.startswith('TASK:'):
                     task_line = line.replace('TASK:', '').strip()
                 elif line.startswith('REASON:'):
                     reason = line.replace('REASON:', '').strip()
 
             # Find the task with the suggested title
-            suggested_task = None
-            for task in available_tasks:
-                if task.title.lower() in task_line.lower():
-                    suggested_task = task
-                    suggested_task.suggestion_reason = reason
-                    return suggested_task
+            suggested_task = self._resolve_suggestion(task_line, reason, candidates)
+            if suggested_task:
+                _SUGGEST_CACHE[cache_key] = (suggested_task.title, reason)
+                return suggested_task
 
             # Fallback to original sorting method if AI suggestion fails
-            available_tasks.sort(key=lambda x: (
-                parser.parse(x.deadline),
-                -x.priority
-            ))
-            return available_tasks[0]
+            return self._fallback_task(hours_until_deadline, available_tasks)
 
         except Exception as e:
             console.print(f"AI suggestion failed: {str(e)}", style="yellow")
             # Fallback to original sorting method
-            available_tasks.sort(key=lambda x: (
-                parser.parse(x.deadline),
-                -x.priority
-            ))
-            return available_tasks[0]
+            return self._fallback_task(hours_until_deadline, available_tasks)
 
     def mark_completed(self, title: str):
-        for task in self.tasks:
-            if task.title == title:
-                task.completed = True
-                break
-        self.save_tasks()
+        task = self._by_title.get(title)
+        if task:
+            task.completed = True
+            self._append_status(task)
 
     def list_tasks(self, show_completed: bool = False):
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Title")
         table.add_column("Description")
@@ -257,28 +534,18 @@ class TodoManager:
         table.add_column("Effort")
         table.add_column("Energy")
 
+        # Styled cells use Rich markup strings rather than a Text object per cell
+        priority_styles = Task.PRIORITY_STYLES
+        status_styles = Task.STATUS_STYLES
         for task in self.tasks:
             if show_completed or not task.completed:
-                priority_style = {
-                    1: "blue",
-                    2: "yellow",
-                    3: "red bold",
-                    4: "red bold reverse"
-                }.get(task.priority, "white")
-                
-                status_style = {
-                    "Not Started": "yellow",
-                    "In Progress": "blue bold",
-                    "Completed": "green"
-                }.get(task.status, "white")
-
                 table.add_row(
                     task.title,
                     task.description,
                     task.deadline,
-                    Text(str(task.priority), style=priority_style),
+                    f"[{priority_styles.get(task.priority, 'white')}]{task.priority}[/]",
                     task.get_mood_with_icon(),
-                    Text(task.status, style=status_style),
+                    f"[{status_styles.get(task.status, 'white')}]{task.status}[/]",
                     task.effort,
                     task.energy_required
                 )
@@ -286,15 +553,24 @@ class TodoManager:
         console.print(table)
 
     def update_task_status(self, title: str, new_status: str):
-        for task in self.tasks:
-            if task.title == title:
-                if new_status == "Completed":
-                    task.completed = True
-                task.status = new_status
-                break
-        self.save_tasks()
+        task = self._by_title.get(title)
+        if task:
+            if new_status == "Completed":
+                task.completed = True
+            task.status = new_status
+            self._append_status(task)
+
+def validate_title(todo_manager, current):
+    from inquirer import errors
+
+    if todo_manager.has_task(current):
+        raise errors.ValidationError('', reason='A task with this title already exists')
+    return True
 
 def validate_date(answers, current):
+    from dateutil import parser
+    from inquirer import errors
+
     if not current:
         raise errors.ValidationError('', reason='Deadline cannot be empty')
     try:
@@ -306,27 +582,46 @@ def validate_date(answers, current):
     except ValueError:
         raise errors.ValidationError('', reason='Please use format YYYY-MM-DD HH:MM')
 
-def suggest_deadline():
-    """Suggest some common deadline options"""
-    now = datetime.now()
-    today_end = now.replace(hour=17, minute=0, second=0, microsecond=0)
-    tomorrow_end = (now + timedelta(days=1)).replace(hour=17, minute=0, second=0, microsecond=0)
-    next_week = (now + timedelta(days=7)).replace(hour=17, minute=0, second=0, microsecond=0)
-    
-    if now.hour < 17:  # If it's before 5 PM
-        today = today_end.strftime("%Y-%m-%d %H:%M")
+ONE_DAY = timedelta(days=1)
+ONE_WEEK = timedelta(days=7)
+
+def _format_deadline(dt: datetime) -> str:
+    """DEADLINE_FORMAT without going through strftime"""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+@functools.lru_cache(maxsize=4)
+def _deadline_options(day: date, before_five: bool) -> tuple:
+    today_end = datetime(day.year, day.month, day.day, 17, 0)
+    tomorrow = _format_deadline(today_end + ONE_DAY)
+    week = _format_deadline(today_end + ONE_WEEK)
+
+    if before_five:
+        today = _format_deadline(today_end)
     else:
-        today = tomorrow_end.strftime("%Y-%m-%d %H:%M")
-        
-    tomorrow = tomorrow_end.strftime("%Y-%m-%d %H:%M")
-    week = next_week.strftime("%Y-%m-%d %H:%M")
-    
-    return [
+        today = tomorrow
+
+    return (
         f"Today ({today})",
         f"Tomorrow ({tomorrow})",
         f"Next week ({week})",
         "Custom date"
-    ]
+    )
+
+def suggest_deadline():
+    """Suggest some common deadline options"""
+    now = datetime.now()
+    return [option for option in _deadline_options(now.date(), now.hour < 17)]
+
+def pass_manager(f):
+    """Like click.pass_obj, but creates the shared TodoManager on first use
+
+    Loading waits until a command actually runs, so '--help' never touches
+    the task file. 'todo shell' passes its own manager in as the context obj.
+    """
+    def new_func(*args, **kwargs):
+        ctx = click.get_current_context()
+        return f(ctx.ensure_object(TodoManager), *args, **kwargs)
+    return functools.update_wrapper(new_func, f)
 
 @click.group()
 def cli():
@@ -334,10 +629,16 @@ def cli():
     pass
 
 @cli.command()
-def add():
+@pass_manager
+def add(todo_manager):
     """Add a new task interactively"""
+    import inquirer
+    from rich.table import Table
+
     questions = [
-        inquirer.Text('title', message="Task title"),
+        inquirer.Text('title',
+                     message="Task title",
+                     validate=lambda _, current: validate_title(todo_manager, current)),
         inquirer.Text('description', message="Task description"),
         inquirer.List('deadline_option',
                      message="Choose deadline",
@@ -387,7 +688,6 @@ def add():
             priority,
             mood
         )
-        todo_manager = TodoManager()
         todo_manager.add_task(task)
         console.print("Task added successfully!", style="green")
         
@@ -411,23 +711,27 @@ def add():
 
 @cli.command()
 @click.option('--all', '-a', is_flag=True, help='Show all tasks including completed ones')
-def list(all):
+@pass_manager
+def list(todo_manager, all):
     """List tasks"""
-    todo_manager = TodoManager()
     todo_manager.list_tasks(show_completed=all)
 
 @cli.command()
 @click.argument('title')
 @click.argument('status', type=click.Choice(['Not Started', 'In Progress', 'Completed']))
-def status(title, status):
+@pass_manager
+def status(todo_manager, title, status):
     """Update a task's status"""
-    todo_manager = TodoManager()
     todo_manager.update_task_status(title, status)
     console.print(f"Task '{title}' status updated to '{status}'!", style="green")
 
 @cli.command()
-def suggest():
+@pass_manager
+def suggest(todo_manager):
     """Get a task suggestion based on current mood"""
+    import inquirer
+    from rich.table import Table
+
     questions = [
         inquirer.List('current_mood',
                      message="How are you feeling right now?",
@@ -442,7 +746,6 @@ def suggest():
     # Extract the mood without the ASCII indicator
     mood = answers['current_mood'].split(' [')[0]
     
-    todo_manager = TodoManager()
     suggested_task = todo_manager.get_suggested_task(mood)
     
     if suggested_task:
@@ -459,18 +762,13 @@ def suggest():
         table.add_column("Energy")
         table.add_column("Status")
         
-        priority_style = {
-            1: "blue",
-            2: "yellow",
-            3: "red bold",
-            4: "red bold reverse"
-        }.get(suggested_task.priority, "white")
+        priority_style = Task.PRIORITY_STYLES.get(suggested_task.priority, "white")
 
         table.add_row(
             suggested_task.title,
             suggested_task.description,
             suggested_task.deadline,
-            Text(str(suggested_task.priority), style=priority_style),
+            f"[{priority_style}]{suggested_task.priority}[/]",
             suggested_task.effort,
             suggested_task.energy_required,
             suggested_task.status
@@ -487,11 +785,46 @@ def suggest():
 
 @cli.command()
 @click.argument('title')
-def complete(title):
+@pass_manager
+def complete(todo_manager, title):
     """Mark a task as completed"""
-    todo_manager = TodoManager()
     todo_manager.mark_completed(title)
     console.print(f"Task '{title}' marked as completed!", style="green")
 
+@cli.command()
+@pass_manager
+def shell(todo_manager):
+    """Run commands interactively against one loaded task list"""
+    console.print("Enter commands without the 'todo' prefix, 'help' to list them, "
+                  "or 'exit' to quit.", style="bold blue")
+    while True:
+        try:
+            line = click.prompt("todo", prompt_suffix="> ")
+        except click.Abort:
+            console.print()
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            console.print(f"Could not parse command: {e}", style="red")
+            continue
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+        if args[0] == "help":
+            args = ["--help"]
+        elif args[0] == "shell":
+            console.print("Already in the shell.", style="yellow")
+            continue
+
+        try:
+            cli.main(args, prog_name="todo", obj=todo_manager, standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except click.Abort:
+            console.print()
+
 if __name__ == '__main__':
     cli()
@@ -0,0 +1,49 @@
+"""Batched urgency scoring for task suggestions"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel is plain NumPy either way
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Indexed by priority; anything outside 1-3 keeps its score unchanged
+PRIORITY_MULTIPLIERS = np.array([1.0, 0.8, 1.0, 1.2, 1.0])
+
+# Flat score for deadlines within 24/48/72 hours; the last slot is the
+# sliding tail used beyond that
+URGENCY_TIERS = np.array([100.0, 80.0, 60.0, 0.0])
+
+# An explicit signature compiles the kernel when this module is imported, and
+# cache=True stores the machine code on disk so later runs load it instead of
+# paying for JIT compilation again.
+@njit("float64[:](float64[:], int8[:], float64)", cache=True)
+def urgency_kernel(deadlines_s, priorities, now_s):
+    """Urgency score per task, matching Task.calculate_urgency_score
+
+    deadlines_s holds POSIX timestamps, NaN where a deadline could not be parsed.
+    The tier ladder is evaluated as a table lookup plus min/max, without
+    per-element branches.
+    """
+    hours = (deadlines_s - now_s) / 3600.0
+    # fmin/fmax map NaN to a valid tier; those rows are overridden below
+    tier = np.fmin(np.fmax(np.ceil(hours / 24.0) - 1.0, 0.0), 3.0).astype(np.int64)
+    tail = np.maximum(10.0, 100.0 - hours / 24.0)
+    urgency = URGENCY_TIERS[tier] + (tier == 3) * tail
+    urgency = urgency * PRIORITY_MULTIPLIERS[np.minimum(np.maximum(priorities, 0), 4)]
+    return np.where(np.isnan(deadlines_s), 10.0, np.minimum(100.0, urgency))
+
+def _deadline_timestamp(task) -> float:
+    try:
+        return task.deadline_dt.timestamp()
+    except (ValueError, OverflowError):
+        return np.nan
+
+def score_tasks(tasks, now):
+    """Return (hours_until_deadline, urgency_scores) arrays for tasks"""
+    deadlines_s = np.array([_deadline_timestamp(task) for task in tasks], dtype=np.float64)
+    priorities = np.array([task.priority for task in tasks], dtype=np.int8)
+    now_s = now.timestamp()
+    hours_until_deadline = (deadlines_s - now_s) / 3600.0
+    return hours_until_deadline, urgency_kernel(deadlines_s, priorities, now_s)
@@ -0,0 +1,23 @@
+from smart_todo.cli import Task, TodoManager
+
+
+def make_task(title):
+    return Task(title, "", "2030-01-01 17:00")
+
+
+def test_compaction_keeps_changes_from_other_managers(tmp_path):
+    filename = str(tmp_path / "tasks.jsonl")
+
+    shell_manager = TodoManager(filename)
+    shell_manager.add_task(make_task("A"))
+
+    # Another todo process appends while the first manager is still open
+    TodoManager(filename).add_task(make_task("B"))
+
+    # Enough updates from the first manager to trigger compaction
+    for status in ["In Progress", "Not Started", "In Progress"]:
+        shell_manager.update_task_status("A", status)
+
+    tasks = TodoManager(filename).tasks
+    assert [task.title for task in tasks] == ["A", "B"]
+    assert tasks[0].status == "In Progress"